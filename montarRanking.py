@@ -7,54 +7,78 @@ Date: April 29, 2025
 """
 
 import re
+import io
 import os
+import glob
+import mmap
 import time
 import pandas as pd
-from operator import itemgetter
+import polars as pl
 from tabulate import tabulate
 import sys
 import colorama
 from colorama import Fore, Back, Style
 import csv
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
+from concurrent.futures import ProcessPoolExecutor
 
 # Initialize colorama for Windows terminal colors
 colorama.init()
 
-def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█', print_end='\n'):
+# Column names and types of a candidate record, in the order they appear in the file
+CANDIDATE_SCHEMA = {
+    'registration': pl.Utf8,
+    'name': pl.Utf8,
+    'p1_score': pl.Float64,
+    'p1_correct': pl.Int32,
+    'p2_score': pl.Float64,
+    'p2_correct': pl.Int32,
+    'final_score': pl.Float64
+}
+
+# Regular expressions used while parsing, compiled once. The input file is
+# memory-mapped, so they work on the raw UTF-8 bytes
+_TITLE_RE = re.compile(r'OPÇÃO (\d+): (.+)'.encode('utf-8'))
+_HEADER_END = 'SUBÁREA:'.encode('utf-8')
+
+# Single cleanup pass over the file: rejoins numbers split by stray spaces ("32. 00",
+# "6 4.00", "102175 89"), turns candidate separators ("/" and the "Resultado final..."
+# paragraphs between the lists) into line breaks, trims the spaces around commas and
+# collapses the remaining line breaks and spaces
+_CLEAN_RE = re.compile(
+    rb'(?P<gap>(?<=[\d.])\s+(?=[\d.]))'
+    rb'|(?P<separator>\s*(?:/|\.\s+Resultado final[^.]*\.)\s*)'
+    rb'|(?P<comma>\s*,\s*)'
+    rb'|\s{2,}|\n'
+)
+_CLEAN_REPLACEMENTS = {'gap': b'', 'separator': b'\n', 'comma': b','}
+
+def _clean(match):
     """
-    Call in a loop to create terminal progress bar with color
+    Replacement for each _CLEAN_RE match
     """
-    percent = ("{0:.1f}").format(100 * (iteration / float(total)))
-    filled_length = int(length * iteration // total)
-    bar = fill * filled_length + '-' * (length - filled_length)
-    
-    # Add colors for better visibility
-    color_prefix = Fore.CYAN + prefix + Style.RESET_ALL
-    color_percent = Fore.GREEN + percent + "%" + Style.RESET_ALL
-    color_bar = Fore.BLUE + "|" + Fore.YELLOW + bar + Fore.BLUE + "|" + Style.RESET_ALL
-    color_suffix = Fore.CYAN + suffix + Style.RESET_ALL
-    
-    print(f'\r{color_prefix} {color_bar} {color_percent} {color_suffix}', end=print_end)
-    sys.stdout.flush()
+    return _CLEAN_REPLACEMENTS.get(match.lastgroup, b' ')
+
+# Progress bar layout, with the colors resolved once
+_C_CYAN = Fore.CYAN
+_C_RESET = Style.RESET_ALL
+_BAR_FMT = (f'\r{_C_CYAN}{{prefix}}{_C_RESET} '
+            f'{Fore.BLUE}|{Fore.YELLOW}{{bar}}{Fore.BLUE}|{_C_RESET} '
+            f'{Fore.GREEN}{{pct:.1f}}%{_C_RESET} '
+            f'{_C_CYAN}{{suffix}}{_C_RESET}{{end}}')
 
-def show_spinner(seconds, message):
+def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█', print_end='\n'):
     """
-    Display a spinner animation for the specified number of seconds
+    Call in a loop to create terminal progress bar with color
     """
-    spinner = ['-', '\\', '|', '/']
-    start_time = time.time()
-    i = 0
-    
-    # Reduced spinner time for speed
-    max_time = min(seconds, 0.2)  # Cap at 0.2 seconds for faster execution
-    
-    while time.time() - start_time < max_time:
-        sys.stdout.write(f'\r{Fore.CYAN}{message} {Fore.YELLOW}{spinner[i % len(spinner)]}{Style.RESET_ALL}')
-        sys.stdout.flush()
-        time.sleep(0.02)  # Reduced sleep time
-        i += 1
+    # Redraw at most ~100 times per bar
+    if iteration != total and iteration % max(1, total // 100) != 0:
+        return
     
-    sys.stdout.write('\r' + ' ' * (len(message) + 10) + '\r')
+    bar = (fill * (length * iteration // total)).ljust(length, '-')
+    sys.stdout.write(_BAR_FMT.format(prefix=prefix, bar=bar, pct=100 * (iteration / float(total)),
+                                     suffix=suffix, end=print_end))
     sys.stdout.flush()
 
 def parse_candidates_data(filename):
@@ -64,163 +88,70 @@ def parse_candidates_data(filename):
     try:
         # Read the file content
         print(f"{Fore.CYAN}Reading file content...{Style.RESET_ALL}")
-        show_spinner(0.2, "Opening and reading file...")
-        
-        with open(filename, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # Extract option title and number
-        show_spinner(0.1, "Extracting option information...")
-        
-        title_pattern = r'OPÇÃO (\d+): (.+)'
-        title_match = re.search(title_pattern, content)
-        option_number = title_match.group(1) if title_match else "Unknown"
-        option_title = title_match.group(2) if title_match else "Unknown"
-        
-        print(f"{Fore.GREEN}Extracted option: {option_number} - {option_title}{Style.RESET_ALL}")
-        
-        # Clean up content for better parsing
-        show_spinner(0.1, "Cleaning up data...")
-        
-        # Primeiro, vamos lidar com o problema do espaço no número decimal
-        content = re.sub(r'(\d+)\.\s+(\d+)', r'\1.\2', content)
-        
-        # Remover quebras de linha e espaços extras
-        cleaned_content = content.replace('\n', ' ').replace('  ', ' ')
         
-        # Split by "/" delimiter which separates candidates
-        candidate_chunks = cleaned_content.split('/')
-        
-        # Process each chunk to extract candidate data
-        entries = []
-        candidates_data_started = False
-        
-        for chunk in candidate_chunks:
-            chunk = chunk.strip()
-            
-            # Skip empty chunks
-            if not chunk:
-                continue
-                
-            # If this is the first chunk, we need to extract the candidate part after the option title
-            if not candidates_data_started and 'OPÇÃO' in chunk:
-                parts = chunk.split('SUBÁREA:')
-                if len(parts) > 1:
-                    chunk = parts[1].strip()
-                    candidates_data_started = True
-                else:
-                    continue
-            else:
-                candidates_data_started = True
+        # The file is memory-mapped and scanned in place instead of being decoded up front
+        with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            # Extract option title and number
+            title_match = _TITLE_RE.search(content)
+            option_number = title_match.group(1).decode('utf-8') if title_match else "Unknown"
+            option_title = title_match.group(2).decode('utf-8').strip() if title_match else "Unknown"
             
-            # Extract raw data using regex with more flexibility
-            pattern = r'(\d+),\s*([\w\s.\-\']+),\s*(\d+\.\d+),\s*(\d+),\s*(\d+\.\d+),\s*(\d+),\s*(\d+\.\d+)'
-            match = re.search(pattern, chunk)
+            print(f"{Fore.GREEN}Extracted option: {option_number} - {option_title}{Style.RESET_ALL}")
             
-            if match:
-                entries.append(match.groups())
-            else:
-                print(f"{Fore.YELLOW}Trying alternative parsing for: {chunk}{Style.RESET_ALL}")
-                
-                # Manual parsing as fallback
-                parts = [p.strip() for p in chunk.split(',')]
-                if len(parts) >= 7:
-                    # Fix any additional formatting issues in the parts
-                    for i in range(2, 7):  # Process the numeric fields
-                        if i < len(parts):
-                            parts[i] = parts[i].replace(' ', '')
-                    
-                    try:
-                        # Validate numeric fields
-                        registration = parts[0]
-                        name = parts[1]
-                        p1_score = float(parts[2])
-                        p1_correct = int(parts[3])
-                        p2_score = float(parts[4])
-                        p2_correct = int(parts[5])
-                        final_score = float(parts[6])
-                        
-                        entries.append((registration, name, str(p1_score), str(p1_correct), 
-                                        str(p2_score), str(p2_correct), str(final_score)))
-                        print(f"{Fore.GREEN}Successfully parsed candidate using manual method{Style.RESET_ALL}")
-                    except (ValueError, IndexError) as e:
-                        print(f"{Fore.RED}Failed to parse: {e} - {parts}{Style.RESET_ALL}")
+            # Clean up content for better parsing, leaving one candidate per line
+            cleaned_content = _CLEAN_RE.sub(_clean, content)
         
-        print(f"{Fore.GREEN}✓ Found {len(entries)} candidates{Style.RESET_ALL}")
+        # Skip the header
+        start = cleaned_content.find(_HEADER_END)
+        if start >= 0:
+            cleaned_content = cleaned_content[start + len(_HEADER_END):]
+        cleaned_content = cleaned_content.strip(b' \n.')
         
-        # Process each candidate entry
-        candidates = []
-        print(f"\n{Fore.YELLOW}⏳ Processing candidates:{Style.RESET_ALL}")
-        total_candidates = len(entries)
+        # Parse all candidates in a single pass; values that do not fit the schema become null
+        candidates = pl.read_csv(
+            io.BytesIO(cleaned_content),
+            has_header=False,
+            separator=',',
+            schema=CANDIDATE_SCHEMA,
+            truncate_ragged_lines=True,
+            ignore_errors=True
+        )
         
-        for i, entry in enumerate(entries):
-            try:
-                # Update progress bar
-                print_progress_bar(i + 1, total_candidates, 
-                                 prefix=f'{Fore.CYAN}Progress:{Style.RESET_ALL}', 
-                                 suffix=f'Complete ({i+1}/{total_candidates})', 
-                                 print_end='\r')
-                
-                registration = entry[0].strip()
-                name = entry[1].strip()
-                p1_score = float(entry[2])
-                p1_correct = int(entry[3])
-                p2_score = float(entry[4])
-                p2_correct = int(entry[5])
-                final_score = float(entry[6])
-                
-                candidate = {
-                    'registration': registration,
-                    'name': name,
-                    'p1_score': p1_score,
-                    'p1_correct': p1_correct,
-                    'p2_score': p2_score,
-                    'p2_correct': p2_correct,
-                    'final_score': final_score
-                }
-                candidates.append(candidate)
-                
-            except (IndexError, ValueError) as e:
-                print(f"\n{Fore.RED}Error processing candidate: {e}{Style.RESET_ALL}")
-                print(f"{Fore.RED}Problematic data: {entry}{Style.RESET_ALL}")
+        # Rows with fields that could not be converted are reported, in a single write, and dropped
+        failed = candidates.filter(pl.any_horizontal(pl.all().is_null()))
+        sys.stdout.write(''.join(f"{Fore.RED}Failed to parse: {row}{Style.RESET_ALL}\n"
+                                 for row in failed.iter_rows()))
+        candidates = candidates.drop_nulls()
         
         print(f"\n{Fore.GREEN}✓ Successfully processed {len(candidates)} candidates{Style.RESET_ALL}")
         return option_number, option_title, candidates
         
     except Exception as e:
         print(f"{Fore.RED}Error processing file: {e}{Style.RESET_ALL}")
-        return "Unknown", "Unknown", []
+        return "Unknown", "Unknown", pl.DataFrame(schema=CANDIDATE_SCHEMA)
 
 def build_ranking(candidates):
     """
-    Sort candidates by final score in descending order
+    Sort candidates by final score in descending order, breaking ties by P1 score
     """
-    print(f"{Fore.YELLOW}⏳ Sorting candidates by final score...{Style.RESET_ALL}")
-    
-    # Show a sorting progress bar - faster animation
-    steps = 5
-    for i in range(steps + 1):
-        print_progress_bar(i, steps, 
-                          prefix=f'{Fore.CYAN}Sorting:{Style.RESET_ALL}', 
-                          suffix=f'Complete', 
-                          print_end='\r')
-        time.sleep(0.01)
-    
-    ranked_candidates = sorted(candidates, key=itemgetter('final_score'), reverse=True)
-    print(f"\n{Fore.GREEN}✓ Ranking completed successfully{Style.RESET_ALL}")
+    # Candidates tied on both scores keep their order from the file
+    ranked_candidates = candidates.sort(['final_score', 'p1_score'], descending=True, maintain_order=True)
+    print(f"{Fore.GREEN}✓ Ranking completed successfully{Style.RESET_ALL}")
     return ranked_candidates
 
+# Cell styles shared by every formatted cell of the Excel output
+_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
+                 top=Side(style='thin'), bottom=Side(style='thin'))
+_CENTER = Alignment(horizontal='center')
+_HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+
 def format_excel(df, writer, option_number, option_title, total_candidates):
     """
     Format the Excel file with headers, colors, and proper column widths
     """
-    # Import the necessary module
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-    
-    # Write the dataframe to Excel
-    df.to_excel(writer, sheet_name='Ranking', startrow=6, index=False)
+    # Write the dataframe to Excel. Columns are handed to pandas as NumPy arrays, so the
+    # rank and correct-answer counts keep their 32-bit integer types
+    pd.DataFrame({column: df[column].to_numpy() for column in df.columns}).to_excel(writer, sheet_name='Ranking', startrow=6, index=False)
     
     # Access the workbook and the worksheet
     workbook = writer.book
@@ -246,27 +177,19 @@ def format_excel(df, writer, option_number, option_title, total_candidates):
     worksheet['A5'].font = normal_font
     
     # Format the table headers (row 7)
-    for col_num, column_title in enumerate(df.columns, 1):
-        col_letter = get_column_letter(col_num)
-        cell = worksheet[f'{col_letter}7']
+    for cell in worksheet[7][:len(df.columns)]:
         cell.font = header_font
         cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-    
-    # Format table
-    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                         top=Side(style='thin'), bottom=Side(style='thin'))
+        cell.alignment = _HEADER_ALIGNMENT
     
-    # Apply borders and center alignment to data
-    for row_num in range(7, len(df) + 8):  # +7 for header rows, +1 for 0-index
-        for col_num in range(1, len(df.columns) + 1):
-            col_letter = get_column_letter(col_num)
-            cell = worksheet[f'{col_letter}{row_num}']
-            cell.border = thin_border
+    # Apply borders and center alignment to data, one row of cells at a time
+    for row in worksheet.iter_rows(min_row=7, max_row=len(df) + 7, min_col=1, max_col=len(df.columns)):
+        for col_num, cell in enumerate(row, 1):
+            cell.border = _BORDER
             
             # Center numeric columns
             if col_num != 3:  # Not the Name column
-                cell.alignment = Alignment(horizontal='center')
+                cell.alignment = _CENTER
     
     # Set column widths
     column_widths = {
@@ -296,28 +219,24 @@ def display_ranking(option_number, option_title, candidates, output_format='csv'
     """
     Display the ranking in a formatted table and save to file in requested format
     """
-    if not candidates:
+    if candidates.is_empty():
         print(f"{Fore.RED}No candidates found.{Style.RESET_ALL}")
         return
     
-    # Create a DataFrame with our data for better presentation - Faster progress
-    print(f"{Fore.YELLOW}⏳ Preparing data for display:{Style.RESET_ALL}")
-    steps = 3  # Fewer steps
-    for i in range(steps + 1):
-        print_progress_bar(i, steps, 
-                          prefix=f'{Fore.CYAN}Preparing:{Style.RESET_ALL}', 
-                          suffix=f'Complete', 
-                          print_end='\r')
-        time.sleep(0.01)  # Much faster
-        
-    df = pd.DataFrame(candidates)
-    df['rank'] = range(1, len(df) + 1)
-    df = df[['rank', 'registration', 'name', 'p1_score', 'p1_correct', 'p2_score', 'p2_correct', 'final_score']]
+    # Anything other than xlsx/csv is saved as a text table; fix the file extension to match
+    output_format = output_format.lower()
+    if output_format not in ('xlsx', 'csv'):
+        output_format = 'txt'
+    if output_file:
+        output_file = os.path.splitext(output_file)[0] + '.' + output_format
+    
+    # Add the rank column to the sorted candidates
+    df = candidates.with_row_index('Rank', offset=1)
     
     # Rename columns for better display
     df.columns = ['Rank', 'Registration', 'Name', 'P1 Score', 'P1 Correct', 'P2 Score', 'P2 Correct', 'Final Score']
     
-    print(f"\n{Fore.GREEN}✓ Data preparation complete{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}✓ Data preparation complete{Style.RESET_ALL}")
     
     # Format the header
     header = [
@@ -328,178 +247,140 @@ def display_ranking(option_number, option_title, candidates, output_format='csv'
     ]
     
     # Print header
-    for line in header:
-        print(line)
+    sys.stdout.write("\n".join(header) + "\n")
     
-    # Generate table for display - Faster progress
-    print(f"{Fore.YELLOW}⏳ Formatting table:{Style.RESET_ALL}")
-    steps = 3
-    for i in range(steps + 1):
-        print_progress_bar(i, steps, 
-                          prefix=f'{Fore.CYAN}Formatting:{Style.RESET_ALL}', 
-                          suffix=f'Complete', 
-                          print_end='\r')
-        time.sleep(0.01)
-    
-    # Create the table
+    # Create the table once. A text file needs every row, and the screen then shows the
+    # top of that same table; otherwise only the first 20 rows are rendered
+    save_table = bool(output_file) and output_format == 'txt'
     table = tabulate(
-        df, 
-        headers='keys',
+        (df if save_table else df.head(20)).iter_rows(), 
+        headers=df.columns,
         tablefmt="grid",
         showindex=False
     )
     
-    print(f"\n{Fore.GREEN}✓ Table formatting complete{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}✓ Table formatting complete{Style.RESET_ALL}")
     
-    # Print the table (show only first 20 rows)
+    # Print the table (grid tables use 3 header lines plus 2 lines per row)
+    screen_lines = 3 + 2 * 20
     print(f"\n{Fore.YELLOW}Ranking Results (showing top 20):{Style.RESET_ALL}")
-    print("\n".join(table.split("\n")[:22]))  # Table header + 20 rows
+    print("\n".join(table.split("\n", screen_lines)[:screen_lines]))
     print(f"\n{Fore.CYAN}... and {len(df)-20 if len(df)>20 else 0} more rows (full results in output file) ...{Style.RESET_ALL}\n")
     
     # Write to file if output_file is specified
     if output_file:
         try:
-            # Determine file extension based on format
-            if output_format.lower() == 'xlsx':
-                if not output_file.lower().endswith('.xlsx'):
-                    output_file = output_file.replace('.txt', '.xlsx').replace('.csv', '.xlsx')
-                    if not output_file.lower().endswith('.xlsx'):
-                        output_file += '.xlsx'
-                
+            if output_format == 'xlsx':
                 print(f"{Fore.YELLOW}⏳ Saving ranking to Excel file...{Style.RESET_ALL}")
                 
-                # Show file writing progress - Faster progress
-                steps = 5
-                for i in range(steps + 1):
-                    print_progress_bar(i, steps, 
-                                      prefix=f'{Fore.CYAN}Saving Excel:{Style.RESET_ALL}', 
-                                      suffix=f'Complete', 
-                                      print_end='\r')
-                    if i == 2:  # Write the file earlier
-                        # Write to Excel with formatting
-                        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                            format_excel(df, writer, option_number, option_title, len(candidates))
-                    time.sleep(0.01)  # Faster progress
-                
-                print(f"\n{Fore.GREEN}✅ Ranking successfully saved to Excel file: {output_file}{Style.RESET_ALL}")
+                # Write to Excel with formatting
+                with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                    format_excel(df, writer, option_number, option_title, len(candidates))
                 
-            elif output_format.lower() == 'csv':
-                if not output_file.lower().endswith('.csv'):
-                    output_file = output_file.replace('.txt', '.csv').replace('.xlsx', '.csv')
-                    if not output_file.lower().endswith('.csv'):
-                        output_file += '.csv'
+                print(f"{Fore.GREEN}✅ Ranking successfully saved to Excel file: {output_file}{Style.RESET_ALL}")
                 
+            elif output_format == 'csv':
                 print(f"{Fore.YELLOW}⏳ Saving ranking to CSV file...{Style.RESET_ALL}")
                 
-                # Show file writing progress - Faster progress
-                steps = 5
-                for i in range(steps + 1):
-                    print_progress_bar(i, steps, 
-                                      prefix=f'{Fore.CYAN}Saving CSV:{Style.RESET_ALL}', 
-                                      suffix=f'Complete', 
-                                      print_end='\r')
-                    if i == 2:  # Write the file earlier
-                        # Write to CSV
-                        df.to_csv(output_file, index=False, encoding='utf-8')
-                    time.sleep(0.01)  # Faster progress
+                # Write to CSV
+                df.write_csv(output_file)
                 
-                print(f"\n{Fore.GREEN}✅ Ranking successfully saved to CSV file: {output_file}{Style.RESET_ALL}")
+                print(f"{Fore.GREEN}✅ Ranking successfully saved to CSV file: {output_file}{Style.RESET_ALL}")
                 
             else:  # Default to table format
-                if not output_file.lower().endswith('.txt'):
-                    output_file = output_file.replace('.csv', '.txt').replace('.xlsx', '.txt')
-                    if not output_file.lower().endswith('.txt'):
-                        output_file += '.txt'
-                        
                 print(f"{Fore.YELLOW}⏳ Saving ranking to text file...{Style.RESET_ALL}")
                 
-                # Show file writing progress - Faster progress
-                steps = 5
-                for i in range(steps + 1):
-                    print_progress_bar(i, steps, 
-                                      prefix=f'{Fore.CYAN}Saving Table:{Style.RESET_ALL}', 
-                                      suffix=f'Complete', 
-                                      print_end='\r')
-                    if i == 2:  # Write the file earlier
-                        # Remove color codes from header for file output
-                        clean_header = [
-                            "\nEMPRESA BRASILEIRA DE PESQUISA AGROPECUÁRIA (EMBRAPA)",
-                            "CONCURSO PÚBLICO - EDITAL Nº 17 – EMBRAPA, DE 28 DE ABRIL DE 2025",
-                            f"\nOPÇÃO {option_number}: {option_title}\n",
-                            f"Total Candidates: {len(candidates)}\n"
-                        ]
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            f.write("\n".join(clean_header))
-                            f.write("\n")
-                            f.write(table)
-                    time.sleep(0.01)  # Faster progress
+                # Remove color codes from header for file output
+                clean_header = [
+                    "\nEMPRESA BRASILEIRA DE PESQUISA AGROPECUÁRIA (EMBRAPA)",
+                    "CONCURSO PÚBLICO - EDITAL Nº 17 – EMBRAPA, DE 28 DE ABRIL DE 2025",
+                    f"\nOPÇÃO {option_number}: {option_title}\n",
+                    f"Total Candidates: {len(candidates)}\n"
+                ]
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(clean_header))
+                    f.write("\n")
+                    f.write(table)
                 
-                print(f"\n{Fore.GREEN}✅ Ranking successfully saved to text file: {output_file}{Style.RESET_ALL}")
+                print(f"{Fore.GREEN}✅ Ranking successfully saved to text file: {output_file}{Style.RESET_ALL}")
                 
         except Exception as e:
-            print(f"\n{Fore.RED}❌ Error writing to file: {e}{Style.RESET_ALL}")
+            print(f"{Fore.RED}❌ Error writing to file: {e}{Style.RESET_ALL}")
 
 def main():
-    input_file = 'opcao_40000188.txt'
-    output_file = 'ranking_40000188.xlsx'  # Changed to XLSX extension
+    # Every option file in the current directory gets its own ranking
+    input_files = sorted(glob.glob('opcao_*.txt'))
     output_format = 'xlsx'  # Default to Excel format
     
     # Record start time for total execution
     total_start_time = time.time()
     
     # Print title with colors
-    print(f"\n{Back.BLUE}{Fore.WHITE} EMBRAPA RANKING GENERATOR {Style.RESET_ALL}\n")
-    print(f"{Fore.CYAN}Building ranking from file: {Fore.YELLOW}{input_file}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Output format: {Fore.YELLOW}{output_format.upper()}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}")
+    sys.stdout.write(
+        f"\n{Back.BLUE}{Fore.WHITE} EMBRAPA RANKING GENERATOR {Style.RESET_ALL}\n\n"
+        f"{Fore.CYAN}Building ranking from files: {Fore.YELLOW}{', '.join(input_files)}{Style.RESET_ALL}\n"
+        f"{Fore.CYAN}Output format: {Fore.YELLOW}{output_format.upper()}{Style.RESET_ALL}\n"
+        f"{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}\n"
+    )
     
     # Show overall progress
     steps = 3
     current_step = 0
     
-    # Step 1: Parse candidate data
+    # Step 1: Parse candidate data, one worker process per file
     print(f"\n{Back.CYAN}{Fore.BLACK} STEP 1: PARSING CANDIDATE DATA {Style.RESET_ALL}")
     start_time = time.time()
-    option_number, option_title, candidates = parse_candidates_data(input_file)
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(parse_candidates_data, input_files))
     current_step += 1
     elapsed = time.time() - start_time
     print_progress_bar(current_step, steps, 
                       prefix=f'{Fore.BLUE}Overall Progress:{Style.RESET_ALL}', 
                       suffix=f'Step {current_step}/{steps} complete - Time: {elapsed:.2f}s', 
-                      print_end='\n')
-    print(f"{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}")
-    
-    if candidates:
+                      print_end=f"\n{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}\n")
+    
+    # Files without candidates are reported and skipped
+    parsed = []
+    for input_file, (option_number, option_title, candidates) in zip(input_files, results):
+        if candidates.is_empty():
+            print(f"{Fore.RED}No candidates found in {input_file}, skipping it{Style.RESET_ALL}")
+        else:
+            output_file = os.path.splitext(input_file.replace('opcao_', 'ranking_', 1))[0] + '.' + output_format
+            parsed.append((option_number, option_title, candidates, output_file))
+    
+    if parsed:
         # Step 2: Build ranking
         print(f"\n{Back.CYAN}{Fore.BLACK} STEP 2: BUILDING RANKING {Style.RESET_ALL}")
         start_time = time.time()
-        ranked_candidates = build_ranking(candidates)
+        rankings = [(option_number, option_title, build_ranking(candidates), output_file)
+                    for option_number, option_title, candidates, output_file in parsed]
         current_step += 1
         elapsed = time.time() - start_time
         print_progress_bar(current_step, steps, 
                           prefix=f'{Fore.BLUE}Overall Progress:{Style.RESET_ALL}', 
                           suffix=f'Step {current_step}/{steps} complete - Time: {elapsed:.2f}s', 
-                          print_end='\n')
-        print(f"{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}")
+                          print_end=f"\n{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}\n")
         
         # Step 3: Display and save ranking
         print(f"\n{Back.CYAN}{Fore.BLACK} STEP 3: GENERATING RESULTS {Style.RESET_ALL}")
         start_time = time.time()
-        display_ranking(option_number, option_title, ranked_candidates, output_format, output_file)
+        for option_number, option_title, ranked_candidates, output_file in rankings:
+            display_ranking(option_number, option_title, ranked_candidates, output_format, output_file)
         current_step += 1
         elapsed = time.time() - start_time
         print_progress_bar(current_step, steps, 
                           prefix=f'{Fore.BLUE}Overall Progress:{Style.RESET_ALL}', 
                           suffix=f'Step {current_step}/{steps} complete - Time: {elapsed:.2f}s', 
-                          print_end='\n')
-        print(f"{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}")
+                          print_end=f"\n{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}\n")
         
         # Final message
         total_elapsed = time.time() - total_start_time
-        print(f"\n{Back.GREEN}{Fore.BLACK} 🎉 RANKING PROCESS COMPLETED SUCCESSFULLY! {Style.RESET_ALL}")
-        print(f"{Fore.GREEN}Total processing time: {total_elapsed:.2f} seconds{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}Output file: {output_file}{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}Candidates found: {len(candidates)}{Style.RESET_ALL}")
+        sys.stdout.write(
+            f"\n{Back.GREEN}{Fore.BLACK} 🎉 RANKING PROCESS COMPLETED SUCCESSFULLY! {Style.RESET_ALL}\n"
+            f"{Fore.GREEN}Total processing time: {total_elapsed:.2f} seconds{Style.RESET_ALL}\n"
+            f"{Fore.GREEN}Output files: {', '.join(ranking[3] for ranking in rankings)}{Style.RESET_ALL}\n"
+            f"{Fore.GREEN}Candidates found: {sum(len(ranking[2]) for ranking in rankings)}{Style.RESET_ALL}\n"
+        )
     else:
         print(f"{Back.RED}{Fore.WHITE} ❌ FAILED TO BUILD RANKING. PLEASE CHECK THE INPUT FILE. {Style.RESET_ALL}")
 